@@ -1,8 +1,12 @@
+import heapq
+import threading
 from collections import defaultdict, namedtuple
-from typing import Any, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 import PySimpleGUI as sg
-from fuzzywuzzy import fuzz
+from rapidfuzz import fuzz
+from rapidfuzz.process import cdist
+from rapidfuzz.utils import default_process
 
 from load import load
 from models import Graph, VertexType, VertexEntity
@@ -39,6 +43,10 @@ KEY_ESCAPE = "Escape:9"
 
 # Custom event to signal updating all listbox values.
 EVENT_UPDATE_ALL = "-EVENT-UPDATE-ALL-"
+# Custom event to signal a searcher input stopped changing; value is the searcher key.
+EVENT_SEARCH_DEBOUNCED = "-EVENT-SEARCH-DEBOUNCED-"
+# Seconds to wait for more typing before filtering on a searcher input.
+DEBOUNCE_SEARCH_SECONDS = 0.15
 # Hardcoded height of listboxes.
 HEIGHT_LISTBOX_BASE = 50
 
@@ -65,6 +73,9 @@ class ListboxHolder:
         self.searcher = searcher
         self.filter_edge_selected = filter_edge_selected
         self.sort_fuzzy_central = sort_fuzzy_central
+        self.last_rendered = None
+        self.prefiltered = None
+        self.filtered = None
 
     # This listbox's key.
     key: str
@@ -92,6 +103,15 @@ class ListboxHolder:
     # in the central_vtx_type vtx_type (if exists).
     sort_fuzzy_central: str
 
+    # The (values, selected indexes) we last put in the sg.Listbox, if any.
+    # Lets us skip redrawing a listbox that wouldn't change.
+    last_rendered: Optional[Tuple[Tuple[Any, ...], Tuple[int, ...]]]
+
+    # The last (inputs, result) of _prefilter and _compute_filtered for this box.
+    # Only the latest is kept, so stale results don't pile up as edges change.
+    prefiltered: Optional[Tuple[tuple, Tuple[VertexEntity, ...]]]
+    filtered: Optional[Tuple[tuple, Tuple[VertexEntity, ...]]]
+
     def __iter__(self):
         yield self.key
         yield self.central
@@ -176,6 +196,8 @@ def start(m: Graph, central_vtx_type: Optional[VertexType] = None) -> None:
     searcher_events = [lb.searcher for lb in boxes]
     frs_events = [lb.filter_edge_selected for lb in boxes]
     ffc_events = [lb.sort_fuzzy_central for lb in boxes]
+    # Pending debounce timers for searcher inputs, by searcher key.
+    search_timers: Dict[str, threading.Timer] = {}
     # If we loaded from file, let's honor the edges we have by filtering.
     _, values = window.read(timeout=1)
     _set_filtered_values(window, EVENT_UPDATE_ALL, boxes, m, values)
@@ -214,9 +236,14 @@ def start(m: Graph, central_vtx_type: Optional[VertexType] = None) -> None:
                 disabled = False
             window[BUTTON_LINK].update(disabled=disabled)
             window[BUTTON_REMOVE].update(disabled=True)
-            _set_filtered_values(window, event, boxes, m, values)
+            if event not in searcher_events:
+                # Searcher input filters on EVENT_SEARCH_DEBOUNCED instead.
+                _set_filtered_values(window, event, boxes, m, values)
         if event in searcher_events:
-            _set_filtered_values(window, event, boxes, m, values)
+            _debounce_search(window, search_timers, event)
+        if event == EVENT_SEARCH_DEBOUNCED:
+            searcher = values[EVENT_SEARCH_DEBOUNCED]
+            _set_filtered_values(window, searcher, boxes, m, values)
         if event in frs_events:
             _set_filtered_values(window, event, boxes, m, values)
         if event in ffc_events:
@@ -236,7 +263,6 @@ def start(m: Graph, central_vtx_type: Optional[VertexType] = None) -> None:
                 else:
                     m.add_edges(*grouped)
                 values = _deselect_all_listbox(window, boxes, values)
-                window[LISTBOX_EDGES].update(values=m.edges)
                 window[BUTTON_LINK].update(disabled=True)
                 if values[CHECKBOX_WRITE]:
                     m.write(m.write(central_vtx_type))
@@ -246,7 +272,6 @@ def start(m: Graph, central_vtx_type: Optional[VertexType] = None) -> None:
             if vals:
                 m.remove_edge(*[x.edge_id for x in vals])
                 values = _deselect_all_listbox(window, boxes, values)
-            window[LISTBOX_EDGES].update(values=m.edges)
             if values[CHECKBOX_WRITE]:
                 m.write(m.write(central_vtx_type))
             _set_filtered_values(window, EVENT_UPDATE_ALL, boxes, m, values)
@@ -257,6 +282,8 @@ def start(m: Graph, central_vtx_type: Optional[VertexType] = None) -> None:
 
         window.refresh()
 
+    for t in search_timers.values():
+        t.cancel()
     window.close()
 
 
@@ -296,6 +323,44 @@ def _automatch(
     m.edges.sumhash_sensitive = False
 
 
+def _compute_filtered(
+    filtered_vals: Tuple[VertexEntity, ...],
+    central_selected: Tuple[VertexEntity, ...],
+) -> Tuple[VertexEntity, ...]:
+    """
+    Return the prefiltered entities, ranked against the central selection if any.
+    """
+    if central_selected:
+        scores = _fuzzy_match(filtered_vals, *central_selected)
+        ranked = zip(scores, filtered_vals)
+        # Only return the top 5 results.
+        top = heapq.nlargest(5, ranked, key=lambda x: x[0])
+        filtered_vals = tuple(x[1] for x in top)
+
+    return filtered_vals
+
+
+def _debounce_search(
+    window: sg.Window, timers: Dict[str, threading.Timer], searcher: str
+) -> None:
+    """
+    (Re)start the debounce timer for the `searcher` input.
+
+    Once typing pauses for DEBOUNCE_SEARCH_SECONDS, the window gets an
+    EVENT_SEARCH_DEBOUNCED event with the searcher key as its value.
+    """
+    if pending := timers.get(searcher):
+        pending.cancel()
+    t = threading.Timer(
+        DEBOUNCE_SEARCH_SECONDS,
+        window.write_event_value,
+        args=(EVENT_SEARCH_DEBOUNCED, searcher),
+    )
+    t.daemon = True
+    timers[searcher] = t
+    t.start()
+
+
 def _deselect_all_listbox(
     window: sg.Window, boxes: Iterable[ListboxHolder], values: dict, *excludes: str
 ) -> dict:
@@ -315,28 +380,36 @@ def _deselect_all_listbox(
     return values
 
 
-def _fuzzy_match(x: VertexEntity, *any_of: VertexEntity) -> int:
+def _fuzzy_match(xs: List[VertexEntity], *any_of: VertexEntity) -> List[float]:
     """
-    Check if `x` is a fuzzy entity name match against any of the `any_of` entities.
+    Score each of `xs` by its best fuzzy entity name match against `any_of`.
+
+    Scores the whole `xs` x `any_of` matrix in one call to rapidfuzz.
     """
-    m = 0
-    for item in any_of:
-        m = max(m, fuzz.partial_ratio(x.entity, item.entity))
-        if m >= 100:
-            return m
-    return m
+    scores = cdist(
+        [x.entity for x in xs],
+        [item.entity for item in any_of],
+        scorer=fuzz.partial_ratio,
+        workers=-1,
+    )
+    return scores.max(axis=1).tolist()
 
 
-def _fuzzy_match_str(x: VertexEntity, *any_of: str) -> int:
+def _fuzzy_match_str(xs: List[VertexEntity], search_string: str) -> Set[int]:
     """
-    Check if `x` is a fuzzy entity name match against any of the `any_of` strings.
+    Return the indexes of `xs` that are a fuzzy entity name match for `search_string`.
     """
-    m = 0
-    for item in any_of:
-        m = max(m, fuzz.WRatio(x.entity, item))
-        if m >= 100:
-            return m
-    return m
+    # Candidates carry a preprocessed `entity_norm`, so only process the query.
+    # Candidates are the rows, so the worker threads split the candidates.
+    scores = cdist(
+        [x.entity_norm for x in xs],
+        [default_process(search_string)],
+        scorer=fuzz.WRatio,
+        processor=None,
+        score_cutoff=75,
+        workers=-1,
+    )
+    return {i for i, score in enumerate(scores[:, 0].tolist()) if score > 75}
 
 
 def _grouped_entities(*vtx_entities: VertexEntity) -> List[List[VertexEntity]]:
@@ -355,6 +428,37 @@ def _grouped_entities_boxes(
     return [item for item in g if item]
 
 
+def _prefilter(
+    m: Graph,
+    vertex: VertexType,
+    search_string: str,
+    hide_edges: bool,
+) -> Tuple[VertexEntity, ...]:
+    """
+    Return the entities of `vertex` that pass the search and edge filters.
+
+    Kept apart from the central fuzzy ranking, so a new central selection
+    only re-ranks these instead of filtering every box from scratch again.
+    """
+    connected = m.edges.connected_entities if hide_edges else ()
+    # Drop entities with edges first, so the search below has fewer to score.
+    filtered_vals = [x for x in vertex.entities if x not in connected]
+
+    if search_string:
+        query = search_string.lower()
+        # Substring hits are cheap; only fuzzy score the entities that miss.
+        residual = [
+            i for i, x in enumerate(filtered_vals) if query not in x.entity_lower
+        ]
+        fuzzy_hits = _fuzzy_match_str(
+            [filtered_vals[i] for i in residual], search_string
+        )
+        misses = {i for n, i in enumerate(residual) if n not in fuzzy_hits}
+        filtered_vals = [x for i, x in enumerate(filtered_vals) if i not in misses]
+
+    return tuple(filtered_vals)
+
+
 def _set_filtered_values(
     window: sg.Window,
     event: str,
@@ -370,51 +474,18 @@ def _set_filtered_values(
     """
     if event == EVENT_UPDATE_ALL:
         for b in boxes:
-            # Don't pass the key, because the `central_vtx_type` vtx_type (if it exists)
-            # will make us do almost double the work.
-            _set_filtered_values(window, b.searcher, boxes, m, values)
+            _update_listbox(window, b, boxes, m, values)
         return
     if not boxes.has(event):
         return
     box = boxes.get(event)
-
-    if not box.vertex:
-        return
-    filtered_vals = box.vertex.entities
-
-    if search_string := values[box.searcher]:
-        filtered_vals = filter(
-            lambda x: x.entity.startswith(search_string)
-            or search_string in x.entity
-            or _fuzzy_match_str(x, search_string) > 75,
-            filtered_vals,
-        )
-    if values[box.filter_edge_selected]:
-        edges = []
-        for _, v in m.edges.edges_by_vertex.items():
-            edges.extend(v)
-        if edges:
-            filtered_vals = filter(lambda x: x not in edges, filtered_vals)
-    if values[box.sort_fuzzy_central] and not box.central:
-        if central_selected := values[boxes.central.key]:
-            ranked = [(_fuzzy_match(x, *central_selected), x) for x in filtered_vals]
-            sorted_by_rank = sorted(ranked, reverse=True, key=lambda x: x[0])
-            # Only return the top 5 results.
-            filtered_vals = [x[1] for x in sorted_by_rank[:5]]
-
-    # Get the filtered values, plus any previously selected entities. In other
-    # words, don't ever filter things that are selected.
-    final_entities = list(set(filtered_vals).union(set(values.get(box.key, set()))))
-    # Order entities in the same way as the VertexType has them originally.
-    original_order = [x for x in box.vertex.entities if x in final_entities]
-    selected_entities = [original_order.index(f) for f in values[box.key]]
-    # Setting values will clear any selected items without set_to_index.
-    window[box.key].update(values=original_order, set_to_index=selected_entities)
-    window[box.counter].update(value=str(len(selected_entities)))
+    _update_listbox(window, box, boxes, m, values)
 
     if box.central and event == box.key:
         # If we updated the central_vtx_type vtx_type, we need to filter all the others that
-        # have the filtering option selected.
+        # have the filtering option selected. Their search and edge filtering is
+        # kept on each box, so this only re-ranks them against the new central
+        # selection.
         to_update = [
             b
             for b in boxes
@@ -423,7 +494,51 @@ def _set_filtered_values(
             and values[b.sort_fuzzy_central]
         ]
         for b in to_update:
-            _set_filtered_values(window, b.sort_fuzzy_central, boxes, m, values)
+            _update_listbox(window, b, boxes, m, values)
+
+
+def _update_listbox(
+    window: sg.Window,
+    box: ListboxHolder,
+    boxes: ListboxCollection,
+    m: Graph,
+    values: dict,
+) -> None:
+    """Filter the entities for `box` and show them in its Listbox."""
+    if not box.vertex:
+        return
+    central_selected = ()
+    if values[box.sort_fuzzy_central] and not box.central:
+        central_selected = tuple(values[boxes.central.key])
+    # Reuse the last results for this box while their inputs are unchanged;
+    # `edges_version` tells us once the edges of `m` change.
+    pre_inputs = (
+        box.vertex,
+        values[box.searcher],
+        values[box.filter_edge_selected],
+        m.edges_version,
+    )
+    if box.prefiltered is None or box.prefiltered[0] != pre_inputs:
+        box.prefiltered = (pre_inputs, _prefilter(m, *pre_inputs[:3]))
+    inputs = (pre_inputs, central_selected)
+    if box.filtered is None or box.filtered[0] != inputs:
+        box.filtered = (inputs, _compute_filtered(box.prefiltered[1], central_selected))
+    filtered_vals = box.filtered[1]
+
+    # Get the filtered values, plus any previously selected entities. In other
+    # words, don't ever filter things that are selected.
+    final_entities = set(filtered_vals)
+    final_entities.update(values.get(box.key, ()))
+    # Order entities in the same way as the VertexType has them originally.
+    original_order = [x for x in box.vertex.entities if x in final_entities]
+    order_idx = {e: i for i, e in enumerate(original_order)}
+    selected_entities = [order_idx[f] for f in values[box.key] if f in order_idx]
+    rendered = (tuple(original_order), tuple(selected_entities))
+    if rendered != box.last_rendered:
+        # Setting values will clear any selected items without set_to_index.
+        window[box.key].update(values=original_order, set_to_index=selected_entities)
+        window[box.counter].update(value=str(len(selected_entities)))
+        box.last_rendered = rendered
 
 
 def _window_init(
@@ -2,7 +2,10 @@
 
 import csv
 import logging
-from typing import Optional, Tuple
+import sys
+from collections import defaultdict
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
 
 from models import Graph, VertexType, Edge, EdgeCollection
 
@@ -21,71 +24,123 @@ def load(filename: str) -> Tuple[Graph, Optional[VertexType]]:
 
 def _load(ff) -> Tuple[Graph, Optional[VertexType]]:
     """Load a Graph from a CSV file with the given filename."""
-    reader = csv.DictReader(ff)
+    reader = csv.reader(ff)
     central_vertex_id: Optional[str] = None
     vertexs = {}
-    edges = []
+    # Entity names per vertex_id, in file order, to add in bulk after the pass.
+    vertex_entities: Dict[str, List[str]] = defaultdict(list)
+    # (vertex_id, entity, vertex_id2, entity2, edge_type, directed) per edge.
+    edge_rows = []
     required_entities = ["entity", "vertex_id"]
-    for i, r in enumerate(reader):
-        # VALIDATE REQUIRED entities.
-        if i == 0:
-            # Only validate headers for the first object, because the rest
-            # should have all the headers we need.
-            for f in required_entities:
-                if f not in r:
-                    raise AttributeError(
-                        f"input CSV must have at least 'entity' and 'vertex_id' headers"
-                    )
+
+    # VALIDATE REQUIRED entities.
+    header = next(reader, None)
+    if header is None:
+        header = []
+    elif any(f not in header for f in required_entities):
+        raise AttributeError(
+            f"input CSV must have at least 'entity' and 'vertex_id' headers"
+        )
+    col_idx = {h: i for i, h in enumerate(header)}
+    width = len(header)
+    # Pull every column we use out of a row in one call. Missing headers point
+    # just past the header row, at the None cell appended to every row below.
+    row_cells = itemgetter(
+        *(
+            col_idx.get(h, width)
+            for h in (
+                "entity",
+                "vertex_id",
+                "vertex_name",
+                "central_vtx_type",
+                "entity2",
+                "vertex_id2",
+                "vertex_name2",
+                "edge_type",
+                "directed",
+            )
+        )
+    )
+    # Short rows read as None, like csv.DictReader.
+    padding = [None] * (width + 1)
+    # Bind hot lookups to locals for the loop.
+    append_edge_row = edge_rows.append
+    make_vertex = _make_vertex
+    intern = sys.intern
+
+    for r in reader:
+        if not r:
+            # Skip blank lines, like csv.DictReader.
+            continue
+        n_cells = len(r)
+        if n_cells > width:
+            del r[width:]
+            n_cells = width
+        r.extend(padding[n_cells:])
+        (
+            vertex_entity,
+            vertex_id,
+            vertex_name,
+            central_vtx_type,
+            n2_entity,
+            n2_id,
+            n2_name,
+            edge_type,
+            dv,
+        ) = row_cells(r)
 
         # MAKE VERTEX TYPE.
-        vertex_id = r["vertex_id"]
-        vertex_name = r.get("vertex_name")
+        if vertex_id:
+            vertex_id = intern(vertex_id)
         if not central_vertex_id and (
-            vertex_name == "CENTRAL" or bool(r.get("central_vtx_type")) == vertex_id
+            vertex_name == "CENTRAL" or bool(central_vtx_type) == vertex_id
         ):
             central_vertex_id = vertex_id
         if vertex_id not in vertexs:
-            n = _make_vertex(vertex_id, vertex_name, central_vertex_id == vertex_id)
+            n = make_vertex(vertex_id, vertex_name, central_vertex_id == vertex_id)
             if n is None:
                 continue
             vertexs[vertex_id] = n
 
         # ADD THIS entity.
-        vertex_entity = r["entity"]
         if not vertex_entity:
             logger.error(
                 "invalid vtx_type entity", vertex_entity, vertex_id, vertex_name
             )
-        gnf = vertexs[vertex_id].add_entity(vertex_entity)
+        vertex_entities[vertex_id].append(vertex_entity)
 
         # ADD RELATED ENTITY.
-        n2_id = r.get("vertex_id2")
-        n2_name = r.get("vertex_name2")
-        if r.get("entity2") and n2_id:
+        if n2_entity and n2_id:
+            n2_id = intern(n2_id)
             n2 = vertexs.get(n2_id)
             if n2 is None:
-                n2 = _make_vertex(n2_id, n2_name, central_vertex_id == n2_id)
+                n2 = make_vertex(n2_id, n2_name, central_vertex_id == n2_id)
                 vertexs[n2_id] = n2
-            n2_entity = r["entity2"]
-            if not n2_entity:
-                logger.error(
-                    "invalid vertex2 entity", vertex_entity, vertex_id, vertex_name
-                )
-            gnf2 = n2.add_entity(n2_entity)
+            vertex_entities[n2_id].append(n2_entity)
 
             # MAKE EDGE TUPLE.
-            dv = r.get("directed")
             directed = dv is not None and str(dv).lower() != "false"
-            edges.append(
-                Edge(
-                    gnf,
-                    gnf2,
-                    edge_id=None,
-                    edge_type=r.get("edge_type"),
-                    directed=directed,
-                )
+            append_edge_row(
+                (vertex_id, vertex_entity, n2_id, n2_entity, edge_type, directed)
             )
 
+    # ADD ENTITIES.
+    # One bulk add per vtx_type, instead of one add per row.
+    for vertex_id, entities in vertex_entities.items():
+        vertexs[vertex_id].add_entities(entities)
+
+    # MAKE EDGES.
+    edges = [
+        Edge(
+            vertexs[vertex_id].entity_by_name(vertex_entity),
+            vertexs[n2_id].entity_by_name(n2_entity),
+            edge_id=None,
+            edge_type=edge_type,
+            directed=directed,
+        )
+        for vertex_id, vertex_entity, n2_id, n2_entity, edge_type, directed in edge_rows
+    ]
+
     # FINAL CENTRALITY UPDATE.
     # This is because we could create a vtx_type before we have a chance to see centrality.
     central_vertex: Optional[VertexType] = vertexs.get(central_vertex_id)
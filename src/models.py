@@ -1,26 +1,39 @@
+import csv
+import io
 import logging
 import random
-import string
+import sys
 from collections import defaultdict
-from typing import Dict, Iterable, List, Optional, Tuple
+from functools import cached_property
+from itertools import permutations, product
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
 
 import graphviz as g
+from rapidfuzz.utils import default_process
 
 logger = logging.getLogger(__name__)
 
+# A key in EdgeCollection.attr_idx_map: the attribute name and its value.
+AttrKey = Tuple[str, Hashable]
+
 
 class VertexEntity:
+    # No per-instance __dict__; a VertexType can hold a lot of these.
+    __slots__ = ("vtx_type", "entity", "entity_lower", "entity_norm", "key", "_hash")
+
     def __init__(self, vtx_type, entity: str):
-        if entity not in vtx_type.raw_entities:
+        if entity not in vtx_type.entities_table:
             raise AttributeError(
                 f"vtx_type '{vtx_type.vertex_id}' does not have entity '{entity}'"
             )
         self.vtx_type = vtx_type
         self.entity = entity
-
-    @property
-    def key(self) -> str:
-        return f"{self.entity}.{self.vtx_type.vertex_id}"
+        # Preprocessed once for searching, instead of on every search.
+        self.entity_lower = entity.lower()
+        self.entity_norm = default_process(entity)
+        # Entities don't change after construction; compute these once.
+        self.key = f"{entity}.{vtx_type.vertex_id}"
+        self._hash = hash(self.key)
 
     def __eq__(self, other):
         if not hasattr(other, "key"):
@@ -31,7 +44,7 @@ class VertexEntity:
         return f"{self.entity}"
 
     def __hash__(self):
-        return hash(self.key)
+        return self._hash
 
 
 class VertexType:
@@ -47,25 +60,48 @@ class VertexType:
         """Create a new VertexType with the specified entities and vertex_id."""
         self.vertex_id = vertex_id or self._make_id()
         self.name = name or self.vertex_id
-        self.raw_entities = [f for f in entities if f]
-        self.entities_table = {f: self._entity(f) for f in entities if f}
+        # Interned, since the same entity names tend to repeat across vtx_types.
+        self.raw_entities = list(dict.fromkeys(sys.intern(f) for f in entities if f))
+        # Names go in before their VertexEntity, which checks for its name here.
+        self.entities_table = dict.fromkeys(self.raw_entities)
+        for f in self.raw_entities:
+            self.entities_table[f] = self._entity(f)
+        # The values of `entities_table`, kept as a list so `entities` is free.
+        self._entities_list = list(self.entities_table.values())
         self.central = central
 
     def add_entity(self, f: str) -> VertexEntity:
         """Add a entity and return the VertexEntity."""
         if not f:
             raise ValueError(f"cannot empty string as entity - got '{f}'")
-        self.raw_entities.append(f)
-        self.entities_table[f] = self._entity(f)
+        if f not in self.entities_table:
+            f = sys.intern(f)
+            self.raw_entities.append(f)
+            self.entities_table[f] = None
+            self.entities_table[f] = self._entity(f)
+            self._entities_list.append(self.entities_table[f])
         return self.entities_table[f]
 
+    def add_entities(self, fs: Iterable[str]) -> List[VertexEntity]:
+        """Add many entities at once and return their VertexEntity, in order."""
+        fs = list(fs)
+        if not all(fs):
+            raise ValueError(f"cannot empty string as entity - got {fs}")
+        new = [sys.intern(f) for f in dict.fromkeys(fs) if f not in self.entities_table]
+        self.raw_entities.extend(new)
+        self.entities_table.update(dict.fromkeys(new))
+        for f in new:
+            self.entities_table[f] = self._entity(f)
+        self._entities_list.extend(self.entities_table[f] for f in new)
+        return [self.entities_table[f] for f in fs]
+
     def entity_by_name(self, f: str) -> Optional[VertexEntity]:
         """Get a entity by name, or None if it doesn't exist."""
         return self.entities_table.get(f)
 
     @property
     def entities(self) -> List[VertexEntity]:
-        return list(self.entities_table.values())
+        return self._entities_list
 
     def _entity(self, entity: str) -> VertexEntity:
         """
@@ -78,8 +114,7 @@ class VertexType:
     @classmethod
     def _make_id(cls) -> str:
         """Make a random vtx_type ID."""
-        r_str = "".join(random.choices(string.ascii_lowercase + string.digits, k=4))
-        return f"vtx_type-{r_str}"
+        return f"vtx_type-{random.getrandbits(20):05x}"
 
     def __bool__(self):
         return True
@@ -93,11 +128,10 @@ class VertexType:
         return hash(self.vertex_id)
 
     def __iter__(self):
-        for gnf in self.entities:
-            yield gnf
+        yield from self._entities_list
 
     def __len__(self):
-        return len(self.entities_table)
+        return len(self._entities_list)
 
     def __repr__(self):
         return f"{self.name} ({self.vertex_id})"
@@ -126,6 +160,14 @@ class Edge:
         self.edge_id = edge_id
         self.edge_type = edge_type
         self.directed = directed
+        # Sumhash is a symmetric way of showing the vertices in this edge.
+        self.sumhash = hash(from_.key) + hash(to_.key)
+        if not directed:
+            # The sumhash is the same if the relation is defined either way.
+            # We are just differing on edge_type
+            self._hash = hash(":".join([str(self.sumhash), edge_type or ""]))
+        else:
+            self._hash = hash(":".join([from_.key, to_.key, edge_type or ""]))
 
     @property
     def type_string(self) -> str:
@@ -140,10 +182,15 @@ class Edge:
     def entity(self) -> str:
         return f"{self.from_.entity} -> {self.to_.entity}"
 
-    @property
-    def sumhash(self) -> int:
-        """Sumhash is a symmetric way of showing the vertices in this edge."""
-        return hash(self.from_.key) + hash(self.to_.key)
+    # Preprocessed for searching on first use, then kept. Only the edges listbox
+    # search reads these, so edges that are never searched skip the work.
+    @cached_property
+    def entity_lower(self) -> str:
+        return self.entity.lower()
+
+    @cached_property
+    def entity_norm(self) -> str:
+        return default_process(self.entity)
 
     def __repr__(self):
         s = f"[{self.from_.key}] {self.type_string} [{self.to_.key}]"
@@ -152,6 +199,13 @@ class Edge:
         return s
 
     def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, Edge):
+            return NotImplemented
+        # Both hashes come from the same fields only when `directed` matches.
+        if self.directed == other.directed and self._hash != other._hash:
+            return False
         if not self.directed:
             if self.edge_type != other.edge_type:
                 return False
@@ -163,13 +217,7 @@ class Edge:
         )
 
     def __hash__(self):
-        if not self.directed:
-            # The sumhash is the same if the relation is defined either way.
-            # We are just differing on edge_type
-            sumhash = hash(self.from_.key) + hash(self.to_.key)
-            return hash(":".join([str(sumhash), self.edge_type or ""]))
-        s = ":".join([self.from_.key, self.to_.key, self.edge_type or ""])
-        return hash(s)
+        return self._hash
 
 
 class EdgeCollection:
@@ -181,9 +229,20 @@ class EdgeCollection:
         self.sumhash_sensitive = False
         # The attr_idx_map answers the question "do we have a Edge for this?"
         # Maps to a value corresponding to the list of indexes containing the key.
-        self.attr_idx_map: Dict[str, List[int]] = defaultdict(list)
+        self.attr_idx_map: Dict[AttrKey, Set[int]] = defaultdict(set)
+        # VertexEntity keys of from_ and to_, parallel to `edges`, for tight scans.
+        self._from_keys: List[str] = []
+        self._to_keys: List[str] = []
         # The IDs for all edges we've ever seen. Pure GUI/referential sugar.
         self.id_ledger: List[int] = []
+        # One past the largest ID in `id_ledger`; IDs only ever go up.
+        self._next_id_counter = 0
+        # Bumped on every change to the collection, so callers can cache derived data.
+        self.version = 0
+        # Indexes of the edges each VertexEntity is the from_ / to_ of, ascending.
+        # Only entities with edges have a key.
+        self._adj_from: Dict[VertexEntity, List[int]] = defaultdict(list)
+        self._adj_to: Dict[VertexEntity, List[int]] = defaultdict(list)
         # Initialize with the provided entity_pairs.
         self.edges = []
         self.edges = self.add(*edges)
@@ -210,20 +269,23 @@ class EdgeCollection:
         return self._delete(intersection)
 
     def delete_by_id(self, *edge_ids: int) -> int:
-        indexes = []
-        for edge_id in edge_ids:
-            indexes.extend(self.attr_idx_map[self._key_id(edge_id)])
+        indexes = {
+            i
+            for edge_id in edge_ids
+            for i in self.attr_idx_map.get(self._key_id(edge_id), ())
+        }
         return self._delete(indexes)
 
     def delete_self_ref(self) -> None:
         """Remove Edges that reference the same VertexEntity for from_ and to_."""
-        idx = [i for i, r in enumerate(self.edges) if r.from_ == r.to_]
+        keys = zip(self._from_keys, self._to_keys)
+        idx = [i for i, (f, t) in enumerate(keys) if f == t]
         self._delete(idx)
 
     def fetch(self, edge_id: int) -> Optional[Edge]:
-        vals = self.attr_idx_map[self._key_id(edge_id)]
+        vals = self.attr_idx_map.get(self._key_id(edge_id))
         if vals:
-            return self.edges[vals[0]]
+            return self.edges[next(iter(vals))]
         return None
 
     def get_for_attrs(
@@ -240,57 +302,101 @@ class EdgeCollection:
             return [self.edges[i] for i in intersection]
         return []
 
+    def get_for_entity(self, entity: VertexEntity) -> List[Edge]:
+        """Return the Edges with the entity as from_ or to_, in collection order."""
+        idxs = self._adj_from.get(entity, [])
+        to_idxs = self._adj_to.get(entity)
+        if to_idxs:
+            idxs = sorted(set(idxs).union(to_idxs))
+        return [self.edges[i] for i in idxs]
+
     @property
     def edges_by_vertex(self) -> Dict[VertexType, List[VertexEntity]]:
         """Return a dictionary of VertexType -> the entities that have entity_pairs here."""
         d = defaultdict(list)
-        for r in self.edges:
-            d[r.from_.vtx_type].append(r.from_)
-            d[r.to_.vtx_type].append(r.to_)
+        for adj in (self._adj_from, self._adj_to):
+            for e, idxs in adj.items():
+                d[e.vtx_type].extend([e] * len(idxs))
         return d
 
+    @property
+    def connected_entities(self) -> Set[VertexEntity]:
+        """Return the VertexEntity that are part of at least one Edge here."""
+        return self._adj_from.keys() | self._adj_to.keys()
+
     def _add(self, r: Edge) -> None:
         """Add the edge to our tracking sets."""
-        if r in self.edges:
-            # This exact edge exists - determined by Edge.__eq__
-            return
-        if self.sumhash_sensitive and not r.directed:
-            if self._key_sumhash(r.sumhash) in self.attr_idx_map:
+        # Any Edge equal to this one has the same sumhash, so only that bucket
+        # needs checking, no matter how many edges we have.
+        candidates = self.attr_idx_map.get(self._key_sumhash(r.sumhash))
+        if candidates:
+            if self.sumhash_sensitive and not r.directed:
                 # Another edge already exists for the vertices in this Edge.
                 return
+            if any(self.edges[i] == r for i in candidates):
+                # This exact edge exists - determined by Edge.__eq__
+                return
         self.edges.append(r)
+        self._from_keys.append(r.from_.key)
+        self._to_keys.append(r.to_.key)
         idx = len(self.edges) - 1
         self._add_to_tables(r, idx)
+        self.version += 1
 
-    def _add_to_tables(self, r: Edge, idx: int) -> List[str]:
+    def _add_to_tables(self, r: Edge, idx: int) -> None:
         """Add the edge to our tracking sets."""
-        keys = [
-            self._key_from(r.from_.key),
-            self._key_to(r.to_.key),
-            self._key_sumhash(r.sumhash),
-        ]
+        m = self.attr_idx_map
+        m[self._key_from(r.from_.key)].add(idx)
+        m[self._key_to(r.to_.key)].add(idx)
+        m[self._key_sumhash(r.sumhash)].add(idx)
         if r.edge_type:
-            keys.append(self._key_type(r.edge_type))
+            m[self._key_type(r.edge_type)].add(idx)
 
         if r.edge_id is not None:
-            keys.append(self._key_id(r.edge_id))
+            m[self._key_id(r.edge_id)].add(idx)
             self.id_ledger.append(r.edge_id)
+            if r.edge_id >= self._next_id_counter:
+                self._next_id_counter = r.edge_id + 1
 
-        for k in keys:
-            self.attr_idx_map[k].append(idx)
-        return keys
+        self._adj_from[r.from_].append(idx)
+        self._adj_to[r.to_].append(idx)
 
     def _delete(self, indexes: Iterable[int]) -> int:
         """Remove the GraphEdges at the given indexes from the collection."""
-        # Remove from the main list first...
-        new_edges = [r for i, r in enumerate(self.edges) if i not in indexes]
-        # Get diff empirically, before setting self.entity_pairs to new list.
-        diff_rels = len(self.edges) - len(new_edges)
-        # Rebuild our entire underlying structures to reflect the removal of items.
-        self.attr_idx_map = defaultdict(list)
-        self.edges = []
-        self.add(*new_edges)
-        return diff_rels
+        drop = set(indexes)
+        # Map the old index of every surviving edge to its new index.
+        remap = {}
+        new_edges = []
+        dropped = []
+        for i, r in enumerate(self.edges):
+            if i in drop:
+                dropped.append(r)
+                continue
+            remap[i] = len(new_edges)
+            new_edges.append(r)
+        if not dropped:
+            return 0
+
+        # Fix up our underlying structures in place, instead of rebuilding them.
+        attr_idx_map = defaultdict(set)
+        for k, v in self.attr_idx_map.items():
+            idxs = {remap[i] for i in v if i in remap}
+            if idxs:
+                attr_idx_map[k] = idxs
+        self.attr_idx_map = attr_idx_map
+        # The remap keeps order, so the adjacency lists stay ascending.
+        for name in ("_adj_from", "_adj_to"):
+            adj = defaultdict(list)
+            for e, v in getattr(self, name).items():
+                idxs = [remap[i] for i in v if i in remap]
+                if idxs:
+                    adj[e] = idxs
+            setattr(self, name, adj)
+        self._from_keys = [k for i, k in enumerate(self._from_keys) if i in remap]
+        self._to_keys = [k for i, k in enumerate(self._to_keys) if i in remap]
+        self.edges = new_edges
+        self.version += 1
+        return len(dropped)
 
     def _get_for_attrs_idx(
         self,
@@ -302,47 +408,49 @@ class EdgeCollection:
         buckets = []
         if from_:
             k = self._key_from(from_.key)
-            buckets.append(self.attr_idx_map[k])
+            buckets.append(self.attr_idx_map.get(k, set()))
         if to_:
             k = self._key_to(to_.key)
-            buckets.append(self.attr_idx_map[k])
+            buckets.append(self.attr_idx_map.get(k, set()))
         if edge_type:
             k = self._key_type(edge_type)
-            buckets.append(self.attr_idx_map[k])
-        intersection = set.intersection(*[set(b) for b in buckets])
+            buckets.append(self.attr_idx_map.get(k, set()))
+        if not buckets:
+            return set()
+        # Start from the smallest bucket; the intersection can't be any bigger.
+        buckets.sort(key=len)
+        intersection = buckets[0].copy()
+        intersection.intersection_update(*buckets[1:])
         return intersection
 
     @staticmethod
-    def _key(prefix: str, stringable: str) -> str:
-        """Make a double-colon-separated key from a stringable object."""
-        return f"{prefix}::{stringable}"
+    def _key(prefix: str, hashable: Hashable) -> AttrKey:
+        """Make a (prefix, value) key; tuples reuse the value's cached hash."""
+        return prefix, hashable
 
-    def _key_from(self, stringable) -> str:
+    def _key_from(self, hashable) -> AttrKey:
         """Make a key for from_."""
-        return self._key("id", stringable)
+        return self._key("from", hashable)
 
-    def _key_id(self, stringable) -> str:
+    def _key_id(self, hashable) -> AttrKey:
         """Make a key for edge_id."""
-        return self._key("id", stringable)
+        return self._key("id", hashable)
 
-    def _key_sumhash(self, stringable) -> str:
+    def _key_sumhash(self, hashable) -> AttrKey:
         """Make a key for sumhash."""
-        return self._key("sumhash", stringable)
+        return self._key("sumhash", hashable)
 
-    def _key_to(self, stringable) -> str:
+    def _key_to(self, hashable) -> AttrKey:
         """Make a key for to_."""
-        return self._key("to", stringable)
+        return self._key("to", hashable)
 
-    def _key_type(self, stringable) -> str:
+    def _key_type(self, hashable) -> AttrKey:
         """Make a key for edge_type."""
-        return self._key("type", stringable)
+        return self._key("type", hashable)
 
     def _next_id(self) -> int:
         """Generate the next available ID in our collection."""
-        new_id = 0
-        if self.id_ledger:
-            new_id = max(self.id_ledger) + 1
-        return new_id
+        return self._next_id_counter
 
     def __iter__(self):
         for item in self.edges:
@@ -368,19 +476,16 @@ class Graph:
         if entity_pairs:
             for r in entity_pairs:
                 self.edges.add(Edge(r[0], r[1]))
-        self._uid = "m-" + "".join(random.choices(string.ascii_lowercase, k=5))
+        self._uid = f"m-{random.getrandbits(24):06x}"
+
+    @property
+    def edges_version(self) -> int:
+        """Changes whenever the edges of this Graph change."""
+        return self.edges.version
 
     def add_edges(self, *groups: List[VertexEntity], edge_type: str = None):
         """Create N-M new GraphEdges."""
-        paired_groups = []
-        for i, group in enumerate(groups):
-            for j, other in enumerate(groups):
-                if i == j:
-                    continue
-                paired_groups.append((group, other))
-
-        for pair in paired_groups:
-            x, y = pair
+        for x, y in permutations(groups, 2):
             self._add_edges(x, y, edge_type=edge_type)
 
     def add_edges_central(
@@ -400,47 +505,19 @@ class Graph:
         do exhaustive error checking before committing changes to the
         underlying EdgeCollection.
         """
-        paired_groups = []
-        for i, group in enumerate(groups):
-            if not group:
-                continue
-            for j, other in enumerate(groups):
-                if not other:
-                    continue
-                if i == j:
-                    continue
-                paired_groups.append((group, other))
-
+        centrals = [g for g in groups if g and g[0].vtx_type == central_vtx_type]
+        others = [g for g in groups if g and g[0].vtx_type != central_vtx_type]
+        if not centrals or not others:
+            return
+        for group in centrals + others:
+            self._check_group(group)
         edges = []
-        for pair in paired_groups:
-            x, y = pair
-            if not x or not y:
-                continue
-            if x[0].vtx_type != central_vtx_type and y[0].vtx_type != central_vtx_type:
-                continue
-            if x[0].vtx_type == y[0].vtx_type:
-                continue
-            central, non = y, x
-            if x[0].vtx_type == central_vtx_type:
-                central, non = x, y
-            c_vertex = None  # For pre-grouping testing.
-            n_vertex = None  # For pre-grouping testing.
-            n_checked_flag = False
-            for c in central:
-                if c_vertex is None:
-                    c_vertex = c.vtx_type
-                if c_vertex != c.vtx_type:
-                    raise ValueError("groups must contain only one VertexType")
-                for n in non:
-                    if n_checked_flag is False:
-                        if n_vertex is None:
-                            n_vertex = n.vtx_type
-                        if n_vertex != n.vtx_type:
-                            raise ValueError("groups must contain only one VertexType")
-                    if c == n:
-                        continue
-                    edges.append(Edge(n, c, edge_type=edge_type))
-                n_checked_flag = True  # Show that we checked `non` for good pre-group.
+        for central, non in product(centrals, others):
+            edges.extend(
+                Edge(n, c, edge_type=edge_type)
+                for c, n in product(central, non)
+                if c != n
+            )
 
         self.edges.add(*edges)
 
@@ -461,54 +538,89 @@ class Graph:
         Write the graph as DOT and CSV. Honor an optional central_vtx_type VertexType.
         """
         dot = g.Graph(comment="Graph")
+        node, edge = dot.node, dot.edge
+        # Every vtx_type gets a node, even one with no edges.
         for n in self.vtx_types:
-            dot.node(
+            node(
                 n.vertex_id, n.name.upper(), color="dodgerblue", fontcolor="dodgerblue3"
             )
+        node_kw = dict(color="gray28", fontcolor="gray14")
+        vtx_edge_kw = dict(color="dodgerblue")
+        edge_kw = dict(color="gray", fontcolor="gray")
+        # One pass over the edges. Each entity node, and its edge to the vtx_type,
+        # is emitted the first time the entity shows up. Entity keys include the
+        # vertex_id, so the key alone also dedupes the vtx_type edge.
+        emitted_entity_nodes = set()
         for r in self.edges.edges:
-            dot.node(r.to_.key, f"{r.to_.entity}", color="gray28", fontcolor="gray14")
-            dot.edge(r.to_.vtx_type.vertex_id, r.to_.key, color="dodgerblue")
+            for e in (r.to_, r.from_):
+                if e.key not in emitted_entity_nodes:
+                    emitted_entity_nodes.add(e.key)
+                    node(e.key, e.entity, **node_kw)
+                    edge(e.vtx_type.vertex_id, e.key, **vtx_edge_kw)
 
-            dot.node(
-                r.from_.key, f"{r.from_.entity}", color="gray28", fontcolor="gray14"
-            )
-            dot.edge(r.from_.vtx_type.vertex_id, r.from_.key, color="dodgerblue")
-
-            dot.edge(
+            edge(
                 r.from_.key,
                 r.to_.key,
                 label=r.edge_type,
                 r_id=str(r.edge_id),
                 dir=None if r.directed else "none",  # Graphviz-specific attr.
-                color="gray",
-                fontcolor="gray",
+                **edge_kw,
             )
         # Renders as PDF and logs filename.
         fn = dot.render(f"out/{self._uid}-graph-mapping.gv")
         logger.info(fn)
         # Render a CSV for easy entity understanding.
-        with open(f"out/{self._uid}-all_entities.gv.csv", "w") as f:
-            f.write(
-                "entity,vertex_name,vertex_id,vertex_central,edge_type,directed,entity2,vertex_name2,vertex_id2"
+        buf = io.StringIO()
+        w = csv.writer(buf, lineterminator="\n")
+        w.writerow(
+            (
+                "entity",
+                "vertex_name",
+                "vertex_id",
+                "vertex_central",
+                "edge_type",
+                "directed",
+                "entity2",
+                "vertex_name2",
+                "vertex_id2",
             )
-            edgeset = set()
-            for vertex in self.vtx_types:
-                central = vertex == central_vtx_type
-                for entity in vertex.entities:
-                    edges = self.edges.get_for_attrs(from_=entity)
-                    edges = edges + self.edges.get_for_attrs(to_=entity)
-                    if edges:
-                        edgeset = edgeset.union(set(edges))
-                    f.write("\n")
-                    f.write(
-                        f"{entity.entity},{vertex.name},{vertex.vertex_id},{central},,,,,"
+        )
+        edgeset: Dict[int, Edge] = {}
+        for vertex in self.vtx_types:
+            central = vertex == central_vtx_type
+            for entity in vertex.entities:
+                for r in self.edges.get_for_entity(entity):
+                    edgeset[r.edge_id] = r
+                w.writerow(
+                    (
+                        entity.entity,
+                        vertex.name,
+                        vertex.vertex_id,
+                        central,
+                        "",
+                        "",
+                        "",
+                        "",
+                        "",
                     )
-            for r in edgeset:
-                central = r.from_.vtx_type == central_vtx_type
-                f.write("\n")
-                f.write(
-                    f"{r.from_.entity},{r.from_.vtx_type.name},{r.from_.vtx_type.vertex_id},{central},{r.edge_type or ''},{r.directed},{r.to_.entity},{r.to_.vtx_type.name},{r.to_.vtx_type.vertex_id}"
                 )
+        for r in edgeset.values():
+            central = r.from_.vtx_type == central_vtx_type
+            w.writerow(
+                (
+                    r.from_.entity,
+                    r.from_.vtx_type.name,
+                    r.from_.vtx_type.vertex_id,
+                    central,
+                    r.edge_type or "",
+                    r.directed,
+                    r.to_.entity,
+                    r.to_.vtx_type.name,
+                    r.to_.vtx_type.vertex_id,
+                )
+            )
+        with open(f"out/{self._uid}-all_entities.gv.csv", "w", newline="") as f:
+            f.write(buf.getvalue())
 
     def _add_edges(
         self,
@@ -518,8 +630,16 @@ class Graph:
         directed: bool = False,
     ):
         """Create N-M new directed GraphEdges."""
-        for f in from_:
-            for t in to_:
-                if f == t:
-                    continue
-                self.edges.add(Edge(f, t, edge_type=edge_type, directed=directed))
+        edges = [
+            Edge(f, t, edge_type=edge_type, directed=directed)
+            for f, t in product(from_, to_)
+            if f != t
+        ]
+        self.edges.add(*edges)
+
+    @staticmethod
+    def _check_group(group: List[VertexEntity]) -> None:
+        """Raise ValueError if the group holds more than one VertexType."""
+        vtx_type = group[0].vtx_type
+        if any(e.vtx_type != vtx_type for e in group):
+            raise ValueError("groups must contain only one VertexType")